@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+from numba import njit, prange, types
+
+# Eagerly compiled for float64 price/volume arrays; cache=True reuses the machine code across runs.
+# Arrays are declared readonly so pandas' copy-on-write views are accepted without copying.
+_ARRAY = types.Array(types.float64, 1, "A", readonly=True)
+_MARKET_STATS_SIGNATURE = types.UniTuple(types.float64, 8)(_ARRAY, _ARRAY, _ARRAY, _ARRAY)
+
+
+@njit(_MARKET_STATS_SIGNATURE, cache=True)
+def market_stats(close, high, low, volume):
+    """
+    Compute the market performance statistics in a single pass over the OHLCV arrays.
+
+    Returns (first_close, last_close, mean_close, std_close, max_high, min_low,
+    mean_volume, max_volume). NaNs are skipped like the pandas reductions, and
+    std_close uses Welford's algorithm with ddof=1. Empty input yields all NaNs.
+    """
+    close_count = 0
+    close_mean = 0.0
+    close_m2 = 0.0
+    max_high = -math.inf
+    min_low = math.inf
+    volume_count = 0
+    volume_sum = 0.0
+    max_volume = -math.inf
+
+    for i in range(close.shape[0]):
+        c = close[i]
+        if not math.isnan(c):
+            close_count += 1
+            delta = c - close_mean
+            close_mean += delta / close_count
+            close_m2 += delta * (c - close_mean)
+
+        h = high[i]
+        if h > max_high:
+            max_high = h
+
+        l = low[i]
+        if l < min_low:
+            min_low = l
+
+        v = volume[i]
+        if not math.isnan(v):
+            volume_count += 1
+            volume_sum += v
+            if v > max_volume:
+                max_volume = v
+
+    nan = math.nan
+    n = close.shape[0]
+    return (
+        close[0] if n > 0 else nan,
+        close[n - 1] if n > 0 else nan,
+        close_mean if close_count > 0 else nan,
+        math.sqrt(close_m2 / (close_count - 1)) if close_count > 1 else nan,
+        max_high if max_high != -math.inf else nan,
+        min_low if min_low != math.inf else nan,
+        volume_sum / volume_count if volume_count > 0 else nan,
+        max_volume if volume_count > 0 else nan,
+    )
+
+
+@njit(parallel=True, cache=True)
+def market_stats_batch(prices, lengths):
+    """
+    Compute market_stats for many tickers at once, one ticker per thread.
+
+    prices is a (ticker, field, time) array with fields ordered Close, High, Low,
+    Volume, so each field's series is contiguous; lengths[t] is the number of
+    valid rows for ticker t (shorter histories are NaN-padded). Returns an
+    (n_tickers, 8) array in the same order as market_stats.
+    """
+    n_tickers = prices.shape[0]
+    out = np.full((n_tickers, 8), np.nan)
+    for t in prange(n_tickers):
+        n = lengths[t]
+        if n == 0:
+            continue
+        stats = market_stats(prices[t, 0, :n], prices[t, 1, :n], prices[t, 2, :n], prices[t, 3, :n])
+        for k in range(8):
+            out[t, k] = stats[k]
+    return out
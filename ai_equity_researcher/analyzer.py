@@ -1,7 +1,108 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Optional, Union
+from ai_equity_researcher.cache import FileCache, MISSING
+from ai_equity_researcher._kernels import market_stats, market_stats_batch
+
+# Result sizes requested by the shared yf.Search used for quotes and news
+SEARCH_MAX_RESULTS = 5
+SEARCH_NEWS_COUNT = 5
+
+MARKET_STAT_FIELDS = ["Close", "High", "Low", "Volume"]
+
+
+@lru_cache(maxsize=128)
+def _get_ticker(ticker_symbol: str) -> yf.Ticker:
+    """Return a shared yfinance Ticker so repeated analyzers reuse its internal caches."""
+    return yf.Ticker(ticker_symbol)
+
+
+@lru_cache(maxsize=None)
+def _quarter_table(year: int) -> Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Build the quarter -> (start, end) Timestamp table for a year."""
+    return {
+        "Q1": (pd.Timestamp(year, 1, 1), pd.Timestamp(year, 3, 31)),
+        "Q2": (pd.Timestamp(year, 4, 1), pd.Timestamp(year, 6, 30)),
+        "Q3": (pd.Timestamp(year, 7, 1), pd.Timestamp(year, 9, 30)),
+        "Q4": (pd.Timestamp(year, 10, 1), pd.Timestamp(year, 12, 31)),
+    }
+
+
+def get_quarter_date_range(year: int, quarter: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Return the (start_date, end_date) pair for a calendar quarter."""
+    quarters = _quarter_table(year)
+
+    if quarter not in quarters:
+        raise ValueError("Invalid quarter. Must be one of 'Q1', 'Q2', 'Q3', 'Q4'.")
+
+    return quarters[quarter]
+
+
+def download_histories(tickers: List[str], start_date, end_date, interval: str = "1d",
+                       cache: Optional[FileCache] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch price histories for many tickers, downloading only the cache misses.
+
+    Missing tickers are fetched together in one yf.download call. yf.download returns
+    a different frame than Ticker.history (no Dividends/Stock Splits columns, tz-naive
+    daily index), so results are cached under their own "price_download" endpoint
+    rather than the "history" entries used by StockAnalyzer.get_ticker_history.
+    """
+    cache = cache if cache is not None else FileCache()
+    params = {"start": start_date, "end": end_date, "interval": interval}
+
+    histories = {ticker_symbol: cache.get(ticker_symbol, "price_download", params) for ticker_symbol in tickers}
+    missing = [ticker_symbol for ticker_symbol, history in histories.items() if history is MISSING]
+    if missing:
+        prices = yf.download(missing, start=start_date, end=end_date, interval=interval,
+                             group_by="ticker", auto_adjust=True, threads=True)
+        for ticker_symbol in missing:
+            histories[ticker_symbol] = prices[ticker_symbol].dropna(how="all")
+            cache.set(ticker_symbol, "price_download", params, histories[ticker_symbol])
+
+    return histories
+
+
+class MarketHistory(NamedTuple):
+    """
+    A price history together with the market statistics computed from that same frame.
+
+    Build instances with from_prices or compute_market_histories_batch so the stats
+    always describe prices.
+    """
+    prices: pd.DataFrame
+    stats: Tuple[float, ...]
+
+    @classmethod
+    def from_prices(cls, prices: pd.DataFrame) -> "MarketHistory":
+        """Compute the stats for a single history in one fused, JIT-compiled pass."""
+        return cls(prices, market_stats(*(prices[field].to_numpy(dtype=np.float64) for field in MARKET_STAT_FIELDS)))
+
+
+def compute_market_histories_batch(histories: Dict[str, pd.DataFrame]) -> Dict[str, MarketHistory]:
+    """
+    Compute the market statistics for many tickers' histories in one parallel call.
+
+    Each history's OHLCV columns are packed into a NaN-padded (ticker, field, time)
+    array for the JIT kernel, and every result is returned paired with its history.
+    """
+    frames = list(histories.values())
+    lengths = np.array([len(frame) for frame in frames], dtype=np.int64)
+
+    stacked = np.full((len(frames), len(MARKET_STAT_FIELDS), max(lengths, default=0)), np.nan)
+    for i, frame in enumerate(frames):
+        stacked[i, :, :lengths[i]] = frame[MARKET_STAT_FIELDS].to_numpy(dtype=np.float64).T
+
+    stats = market_stats_batch(stacked, lengths)
+    return {
+        ticker_symbol: MarketHistory(frame, tuple(float(x) for x in stats[i]))
+        for i, (ticker_symbol, frame) in enumerate(histories.items())
+    }
+
+
 class StockAnalyzer:
     """
     A comprehensive stock analysis tool that provides various types of financial and market data analysis.
@@ -15,16 +116,42 @@ class StockAnalyzer:
     6. Report Generation: Comprehensive analysis reports
     """
 
-    def __init__(self, ticker_symbol: str):
-        """Initialize the StockAnalyzer with a specific ticker symbol."""
+    def __init__(self, ticker_symbol: str, cache: Optional[FileCache] = None):
+        """
+        Initialize the StockAnalyzer with a specific ticker symbol.
+
+        yfinance responses are persisted through cache (a FileCache by default).
+        """
         self.ticker_symbol = ticker_symbol
-        self.ticker = yf.Ticker(ticker_symbol)
+        self.ticker = _get_ticker(ticker_symbol)
+        self.cache = cache if cache is not None else FileCache()
+        self._info = None
+        self._search_result = None
+
+    def _cached(self, endpoint: str, params: Optional[Dict], loader: Callable[[], Any]) -> Any:
+        """Return the cached response for endpoint/params, calling loader on a miss."""
+        value = self.cache.get(self.ticker_symbol, endpoint, params)
+        if value is MISSING:
+            value = loader()
+            self.cache.set(self.ticker_symbol, endpoint, params, value)
+        return value
+
+    @property
+    def info(self) -> Dict:
+        """Ticker info dict, fetched on first access and reused afterwards."""
+        if self._info is None:
+            self._info = self._cached("info", None, lambda: self.ticker.info)
+        return self._info
 
     def get_ticker_history(self, start_date: Optional[str] = None, 
                          end_date: Optional[str] = None, 
                          interval: str = "1d") -> pd.DataFrame:
         """Fetch historical price and volume data."""
-        return self.ticker.history(start=start_date, end=end_date, interval=interval)
+        return self._cached(
+            "history",
+            {"start": start_date, "end": end_date, "interval": interval},
+            lambda: self.ticker.history(start=start_date, end=end_date, interval=interval),
+        )
 
     # ==========================================
     # 1. Basic Company Information Methods
@@ -32,7 +159,7 @@ class StockAnalyzer:
     
     def get_company_overview(self) -> Dict:
         """Fetch basic company information and overview data."""
-        info = self.ticker.info
+        info = self.info
         return {
             # Basic Information
             "name": info.get("longName", "N/A"),
@@ -43,7 +170,7 @@ class StockAnalyzer:
         }
     def get_ticker_info(self) -> Dict:
         """Fetch detailed ticker information."""
-        return self.ticker.info
+        return self.info
 
     # ==========================================
     # 2. Financial Analysis Methods
@@ -52,9 +179,9 @@ class StockAnalyzer:
     def fetch_financial_statements(self) -> Dict:
         """Fetch financial statements and key financial metrics for a ticker."""
         try:
-            financials = self.ticker.quarterly_financials
-            cash_flow = self.ticker.quarterly_cashflow
-            info = self.ticker.info
+            financials = self._cached("quarterly_financials", None, lambda: self.ticker.quarterly_financials)
+            cash_flow = self._cached("quarterly_cashflow", None, lambda: self.ticker.quarterly_cashflow)
+            info = self.info
 
             # Initialize default values
             data = {
@@ -142,20 +269,27 @@ class StockAnalyzer:
     # 3. Market Analysis Methods
     # ==========================================
 
-    def get_market_performance_and_insight(self, start_date: str, end_date: str) -> Dict:
+    def get_market_performance_and_insight(self, start_date: str, end_date: str,
+                                           history: Optional[Union[pd.DataFrame, MarketHistory]] = None) -> Dict:
         """Analyze market performance metrics and provide insights for a specific period."""
-        history = self.ticker.history(start=start_date, end=end_date)
-        info = self.ticker.info
-        if history.empty:
+        if history is None:
+            history = self.get_ticker_history(start_date, end_date)
+        if isinstance(history, pd.DataFrame):
+            history = MarketHistory.from_prices(history)
+        info = self.info
+        if history.prices.empty:
             return {"error": "No market data available for the specified period."}
 
-        current_price = int(history["Close"].iloc[-1])
-        average_price = int(history["Close"].mean())
-        price_change = ((history["Close"].iloc[-1] - history["Close"].iloc[0]) / history["Close"].iloc[0]) * 100
-        high_low_spread = ((history["High"].max() - history["Low"].min()) / history["Close"].mean()) * 100
-        volatility = float(history["Close"].std())
-        average_volume = int(history["Volume"].mean())
-        max_volume = int(history["Volume"].max())
+        (first_close, last_close, mean_close, std_close,
+         max_high, min_low, mean_volume, max_volume) = history.stats
+
+        current_price = int(last_close)
+        average_price = int(mean_close)
+        price_change = ((last_close - first_close) / first_close) * 100
+        high_low_spread = ((max_high - min_low) / mean_close) * 100
+        volatility = float(std_close)
+        average_volume = int(mean_volume)
+        max_volume = int(max_volume)
 
         return {
             "current_price": current_price,
@@ -187,7 +321,7 @@ class StockAnalyzer:
 
     def get_sector_and_industry_data(self) -> Tuple[Optional[Dict], Optional[Dict]]:
         """Fetch detailed sector and industry metrics."""
-        info = self.ticker.info
+        info = self.info
         sector_key = info.get('sectorKey', None)
         industry_key = info.get('industryKey', None)
 
@@ -195,39 +329,47 @@ class StockAnalyzer:
         industry_data = None
 
         if sector_key:
-            sector = yf.Sector(sector_key)
-            sector_data = {
-                "key": sector.key,
-                "name": sector.name,
-                "symbol": sector.symbol,
-                "overview": sector.overview,
-                "top_companies": sector.top_companies,
-                "top_etfs": sector.top_etfs,
-                "top_mutual_funds": sector.top_mutual_funds,
-                "industries": sector.industries,
-            }
+            sector_data = self._cached("sector", {"key": sector_key}, lambda: self._load_sector_data(sector_key))
 
         if industry_key:
-            industry = yf.Industry(industry_key)
-            industry_data = {
-                "key": industry.key,
-                "name": industry.name,
-                "sector_key": industry.sector_key,
-                "sector_name": industry.sector_name,
-                "top_performing_companies": industry.top_performing_companies,
-                "top_growth_companies": industry.top_growth_companies,
-            }
+            industry_data = self._cached("industry", {"key": industry_key}, lambda: self._load_industry_data(industry_key))
 
         return sector_data, industry_data
 
+    @staticmethod
+    def _load_sector_data(sector_key: str) -> Dict:
+        sector = yf.Sector(sector_key)
+        return {
+            "key": sector.key,
+            "name": sector.name,
+            "symbol": sector.symbol,
+            "overview": sector.overview,
+            "top_companies": sector.top_companies,
+            "top_etfs": sector.top_etfs,
+            "top_mutual_funds": sector.top_mutual_funds,
+            "industries": sector.industries,
+        }
+
+    @staticmethod
+    def _load_industry_data(industry_key: str) -> Dict:
+        industry = yf.Industry(industry_key)
+        return {
+            "key": industry.key,
+            "name": industry.name,
+            "sector_key": industry.sector_key,
+            "sector_name": industry.sector_name,
+            "top_performing_companies": industry.top_performing_companies,
+            "top_growth_companies": industry.top_growth_companies,
+        }
+
     # ==========================================
     # 5. External Analysis Methods
     # ==========================================
 
     def get_ticker_recommendations(self) -> Dict:
         """Fetch analyst recommendations and format them as a dictionary."""
-        recommendations = self.ticker.recommendations
-        info = self.ticker.info
+        recommendations = self._cached("recommendations", None, lambda: self.ticker.recommendations)
+        info = self.info
         if recommendations is None or recommendations.empty:
             return {"error": "No recommendations data available."}
 
@@ -244,21 +386,39 @@ class StockAnalyzer:
         }
 
 
-    def get_related_quotes(self, max_results: int = 5) -> List:
-        """Find related securities and quotes."""
-        search = yf.Search(self.ticker_symbol, max_results=max_results)
-        return search.quotes
+    @property
+    def _search(self) -> yf.Search:
+        """A single yfinance Search serving both quotes and news, created on first access."""
+        if self._search_result is None:
+            self._search_result = yf.Search(
+                self.ticker_symbol, max_results=SEARCH_MAX_RESULTS, news_count=SEARCH_NEWS_COUNT
+            )
+        return self._search_result
 
-    def get_recent_news(self, news_count: int = 5) -> List[Dict]:
+    def get_related_quotes(self, max_results: int = SEARCH_MAX_RESULTS) -> List:
+        """Find related securities and quotes."""
+        return self._cached(
+            "quotes",
+            {"max_results": max_results},
+            lambda: (self._search.quotes[:max_results] if max_results <= SEARCH_MAX_RESULTS
+                     else yf.Search(self.ticker_symbol, max_results=max_results).quotes),
+        )
+
+    def get_recent_news(self, news_count: int = SEARCH_NEWS_COUNT) -> List[Dict]:
         """Fetch recent news and events."""
-        search = yf.Search(self.ticker_symbol, news_count=news_count)
-        return search.news
+        return self._cached(
+            "news",
+            {"news_count": news_count},
+            lambda: (self._search.news[:news_count] if news_count <= SEARCH_NEWS_COUNT
+                     else yf.Search(self.ticker_symbol, news_count=news_count).news),
+        )
 
     # ==========================================
     # 6. Report Generation Methods
     # ==========================================
 
-    def generate_report(self, year: int, quarter: str) -> Dict:
+    def generate_report(self, year: int, quarter: str,
+                        history: Optional[Union[pd.DataFrame, MarketHistory]] = None) -> Dict:
         """
         Generate a comprehensive analysis report organized by data category.
         
@@ -271,19 +431,14 @@ class StockAnalyzer:
         - Technical Statistics
         - Related Securities
         - Recent News
-        """
-        quarters = {
-            "Q1": (f"{year}-01-01", f"{year}-03-31"),
-            "Q2": (f"{year}-04-01", f"{year}-06-30"),
-            "Q3": (f"{year}-07-01", f"{year}-09-30"),
-            "Q4": (f"{year}-10-01", f"{year}-12-31"),
-        }
-
-        if quarter not in quarters:
-            raise ValueError("Invalid quarter. Must be one of 'Q1', 'Q2', 'Q3', 'Q4'.")
 
-        start_date, end_date = quarters[quarter]
-        history = self.get_ticker_history(start_date, end_date)
+        history, if given (a price frame, or a MarketHistory from
+        compute_market_histories_batch), must cover the requested quarter; it is
+        used instead of fetching the quarter's prices again.
+        """
+        start_date, end_date = get_quarter_date_range(year, quarter)
+        if history is None:
+            history = self.get_ticker_history(start_date, end_date)
         
         report = {
             "ticker": self.ticker_symbol,
@@ -291,7 +446,7 @@ class StockAnalyzer:
             "sections": [
                 {"name": "Company Overview", "data": self.get_company_overview()},
                 {"name": "Financial Performance", "data": self.fetch_financial_statements()},
-                {"name": "Market Performance", "data": self.get_market_performance_and_insight(start_date, end_date)},
+                {"name": "Market Performance", "data": self.get_market_performance_and_insight(start_date, end_date, history=history)},
                 {"name": "Analyst Recommendations", "data": self.get_ticker_recommendations()},
                 {"name": "Recent News", "data": self.get_recent_news()}
             ]
@@ -0,0 +1,144 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Time-to-live (seconds) per cached endpoint
+DEFAULT_TTLS = {
+    "info": DAY,
+    "recommendations": DAY,
+    "quarterly_financials": 7 * DAY,
+    "quarterly_cashflow": 7 * DAY,
+    "history": DAY,
+    "price_download": DAY,
+    "news": HOUR,
+    "quotes": DAY,
+    "sector": DAY,
+    "industry": DAY,
+}
+
+# Returned by FileCache.get on a miss or expired entry
+MISSING = object()
+
+
+def _is_empty(value: Any) -> bool:
+    """True for None and empty frames/containers, which usually mean a failed fetch."""
+    if value is None:
+        return True
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.empty
+    if isinstance(value, (dict, list, tuple)):
+        return len(value) == 0
+    return False
+
+
+def _encode_index(value: Any) -> Dict:
+    """Index metadata that orient="split" JSON drops: the index name and its timezone."""
+    index = value.index
+    tz = index.tz if isinstance(index, pd.DatetimeIndex) else None
+    return {"index_name": index.name, "index_tz": str(tz) if tz is not None else None}
+
+
+def _decode_index(value: Any, meta: Dict) -> Any:
+    """Restore the index name and convert the (UTC) decoded index back to its original timezone."""
+    if meta.get("index_tz") is not None:
+        value.index = pd.to_datetime(value.index, utc=True).tz_convert(meta["index_tz"])
+    value.index.name = meta.get("index_name")
+    return value
+
+
+def _encode(value: Any) -> Any:
+    """Convert yfinance results into JSON-serializable structures."""
+    if isinstance(value, pd.DataFrame):
+        return {"__dataframe__": value.to_json(orient="split", date_format="iso"), **_encode_index(value)}
+    if isinstance(value, pd.Series):
+        return {"__series__": value.to_json(orient="split", date_format="iso"), **_encode_index(value)}
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode."""
+    if isinstance(value, dict):
+        if "__dataframe__" in value:
+            frame = pd.read_json(io.StringIO(value["__dataframe__"]), orient="split", dtype=False)
+            return _decode_index(frame, value)
+        if "__series__" in value:
+            series = pd.read_json(io.StringIO(value["__series__"]), orient="split", typ="series", dtype=False)
+            return _decode_index(series, value)
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class FileCache:
+    """
+    A persistent JSON file cache for yfinance responses.
+
+    Entries are stored as .cache/<ticker>/<endpoint>_<hash>.json, where the hash
+    is derived from the request parameters, and expire after a per-endpoint TTL.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = DAY):
+        self.cache_dir = cache_dir
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+
+    def _path(self, ticker: str, endpoint: str, params: Optional[Dict]) -> str:
+        key = json.dumps(params or {}, sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, ticker, f"{endpoint}_{digest}.json")
+
+    def get(self, ticker: str, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Return the cached value, or MISSING if absent or expired."""
+        path = self._path(ticker, endpoint, params)
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return MISSING
+            with open(path, "r", encoding="utf-8") as f:
+                return _decode(json.load(f))
+        except (OSError, ValueError):
+            return MISSING
+
+    def set(self, ticker: str, endpoint: str, params: Optional[Dict], value: Any) -> None:
+        """
+        Store a value in the cache. Failures are reported but never raised.
+
+        None and empty results are not stored, so a transient fetch failure is
+        retried on the next run instead of being served for the whole TTL.
+        """
+        if _is_empty(value):
+            return
+        path = self._path(ticker, endpoint, params)
+        # Write to a temporary file first so concurrent readers never see partial JSON
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_encode(value), f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error writing cache entry {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
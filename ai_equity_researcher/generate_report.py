@@ -1,37 +1,47 @@
-from fpdf import FPDF
+from fpdf import FPDF, XPos, YPos
 from datetime import datetime
+import pandas as pd
 import re
 
+_SANITIZE = re.compile(r'[^a-zA-Z0-9 ]')
+
+LOGO_PATH = 'static/logo.jpg'
+
 class EquityResearchReport(FPDF):
+    def __init__(self, *args, logo_path=LOGO_PATH, **kwargs):
+        super().__init__(*args, **kwargs)
+        # fpdf2 keeps decoded images in its image cache, so the logo is only parsed once per document
+        self._logo_path = logo_path
+
     def header(self):
-        self.image('static/logo.jpg', 10, 8, 20)  
-        self.set_font('Arial', 'B', 15)
-        self.cell(0, 10, 'Equity Research Report', 0, 1, 'C')
+        self.image(self._logo_path, 10, 8, 20)
+        self.set_font('Helvetica', 'B', 15)
+        self.cell(0, 10, 'Equity Research Report', 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
         self.ln(10) 
 
 
     def footer(self):
         self.set_y(-5)
-        self.set_font('Arial', 'I', 8)
-        self.cell(0, 5, 'Disclaimer: The insights in this report are AI-generated and should not be considered as financial advice.', 0, 1, 'C')
-        self.cell(0, 5, f'Page {self.page_no()}/{{nb}}', 0, 0, 'C')
+        self.set_font('Helvetica', 'I', 8)
+        self.cell(0, 5, 'Disclaimer: The insights in this report are AI-generated and should not be considered as financial advice.', 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+        self.cell(0, 5, f'Page {self.page_no()}', 0, align='C')
 
     def chapter_title(self, title):
-        self.set_font('Arial', 'B', 12)
+        self.set_font('Helvetica', 'B', 12)
         self.set_fill_color(200, 220, 255)
-        self.cell(0, 6, title, 0, 1, 'L', 1)
+        self.cell(0, 6, title, 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L', fill=True)
         self.ln(4)
 
     def chapter_body(self, body):
-        self.set_font('Arial', 'B', 10)
-        self.cell(0, 5, "AI Insights:", 0, 1)
-        self.set_font('Arial', '', 10)
+        self.set_font('Helvetica', 'B', 10)
+        self.cell(0, 5, "AI Insights:", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.set_font('Helvetica', '', 10)
         self.multi_cell(0, 5, body)
         self.ln()
 
     def ai_signal(self, signal):
         self.ln(2)
-        self.set_font('Arial', 'B', 10)
+        self.set_font('Helvetica', 'B', 10)
         if signal == 1:
             self.set_text_color(0, 128, 0)  # Green for positive
             signal_text = "[POSITIVE]"
@@ -41,14 +51,16 @@ class EquityResearchReport(FPDF):
         else:
             self.set_text_color(128, 0, 0)  # Red for negative
             signal_text = "[NEGATIVE]"
-        self.cell(0, 5, f"AI Signal: {signal_text}", 0, 1, 'L')
+        self.cell(0, 5, f"AI Signal: {signal_text}", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
         self.set_text_color(0, 0, 0)  # Reset text color
         self.ln(4)
 
-    def financial_metric(self, label, value):
-        self.set_font('Arial', '', 10)
-        self.cell(60, 5, label, 0, 0)
-        self.cell(0, 5, str(value), 0, 1)
+    def financial_metrics_table(self, pairs):
+        # Set the font once for the whole block of label/value rows
+        self.set_font('Helvetica', '', 10)
+        for label, value in pairs:
+            self.cell(60, 5, label, 0)
+            self.cell(0, 5, str(value), 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
 def format_currency(value):
     if isinstance(value, str) and value.startswith('$'):
@@ -58,6 +70,15 @@ def format_currency(value):
     except (ValueError, TypeError):
         return str(value)
 
+def format_currency_series(values):
+    """Series form of format_currency: numeric entries are coerced in one pass, only the rest fall back to format_currency."""
+    numeric = pd.to_numeric(values, errors='coerce')
+    mask = numeric.notna()
+    formatted = values.astype(object).copy()
+    formatted[mask] = numeric[mask].map('${:,.2f}'.format)
+    formatted[~mask] = values[~mask].map(format_currency)
+    return formatted
+
 def format_percentage(value):
     try:
         return f"{float(value):.2f}%"
@@ -65,36 +86,52 @@ def format_percentage(value):
         return str(value)
 
 def save_report_to_pdf(data, ticker_symbol):
+    sections_by_name = {s['name']: s for s in data['sections']}
+
     pdf = EquityResearchReport()
-    pdf.alias_nb_pages()
     pdf.add_page()
     
-    pdf.set_font('Arial', 'B', 16)
-    pdf.cell(0, 10, f"{data['sections'][0]['data']['name']} ({ticker_symbol})", 0, 1, 'C')
-    pdf.set_font('Arial', '', 10)
-    pdf.cell(0, 5, f"Report Date: {data['report_date']}", 0, 1, 'C')
-    pdf.set_font('Arial', 'I', 8)
-    pdf.cell(0, 5, "This report contains AI-generated insights and signals", 0, 1, 'C')
+    pdf.set_font('Helvetica', 'B', 16)
+    pdf.cell(0, 10, f"{sections_by_name['Company Overview']['data']['name']} ({ticker_symbol})", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+    pdf.set_font('Helvetica', '', 10)
+    pdf.cell(0, 5, f"Report Date: {data['report_date']}", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+    pdf.set_font('Helvetica', 'I', 8)
+    pdf.cell(0, 5, "This report contains AI-generated insights and signals", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
     pdf.ln(10)
 
-    overview_section = next(s for s in data['sections'] if s['name'] == 'Company Overview')
+    overview_section = sections_by_name['Company Overview']
+    market_section = sections_by_name['Market Performance']
+    analyst_section = sections_by_name['Analyst Recommendations']
+    market_data = market_section['data']
+    analyst_data = analyst_section['data']
+
+    # Format every currency figure in the report in one vectorized pass
+    currency = format_currency_series(pd.Series({
+        'current_price': market_data['current_price'],
+        '52_week_low': market_data['52_week_low'],
+        '52_week_high': market_data['52_week_high'],
+        'market_cap': overview_section['data']['market_cap'],
+        'target_low_price': analyst_data['target_low_price'],
+        'target_high_price': analyst_data['target_high_price'],
+    }, dtype=object))
+
     pdf.chapter_title('Company Overview')
     pdf.chapter_body(overview_section['insight'])
     pdf.ai_signal(overview_section['signal'])
 
-    market_section = next(s for s in data['sections'] if s['name'] == 'Market Performance')
     pdf.chapter_title('Market Performance')
-    market_data = market_section['data']
-    pdf.financial_metric('Current Price:', format_currency(market_data['current_price']))
-    pdf.financial_metric('52-Week Range:', f"{format_currency(market_data['52_week_low'])} - {format_currency(market_data['52_week_high'])}")
-    pdf.financial_metric('Price Change:', market_data['price_change'])
-    pdf.financial_metric('Market Cap:', format_currency(data['sections'][0]['data']['market_cap']))
-    pdf.financial_metric('Beta:', market_data['beta'])
+    pdf.financial_metrics_table([
+        ('Current Price:', currency['current_price']),
+        ('52-Week Range:', f"{currency['52_week_low']} - {currency['52_week_high']}"),
+        ('Price Change:', market_data['price_change']),
+        ('Market Cap:', currency['market_cap']),
+        ('Beta:', market_data['beta']),
+    ])
     pdf.ln(5)
     pdf.chapter_body(market_section['insight'])
     pdf.ai_signal(market_section['signal'])
 
-    financial_section = next(s for s in data['sections'] if s['name'] == 'Financial Performance')
+    financial_section = sections_by_name['Financial Performance']
     pdf.chapter_title('Financial Performance')
     fin_data = financial_section['data']
     
@@ -107,49 +144,50 @@ def save_report_to_pdf(data, ticker_symbol):
         ('Current Ratio', 'current_ratio')
     ]
     
+    # Statement amounts already arrive formatted as "$x,xxx.xx" and are shown as-is
+    fin_rows = []
     for label, key in key_metrics:
         if key in fin_data:
             value = fin_data[key]
             if isinstance(value, float) and 'ratio' not in key.lower():
                 value = format_percentage(value * 100)
-            elif isinstance(value, str) and value.startswith('$'):
-                value = format_currency(value.replace('$', '').replace(',', ''))
-            pdf.financial_metric(label + ':', value)
+            fin_rows.append((label + ':', value))
+    pdf.financial_metrics_table(fin_rows)
     
     pdf.ln(5)
     pdf.chapter_body(financial_section['insight'])
     pdf.ai_signal(financial_section['signal'])
 
-    analyst_section = next(s for s in data['sections'] if s['name'] == 'Analyst Recommendations')
     pdf.chapter_title('Analyst Recommendations')
-    analyst_data = analyst_section['data']
-    pdf.financial_metric('Target Price Range:', f"{format_currency(analyst_data['target_low_price'])} - {format_currency(analyst_data['target_high_price'])}")
-    pdf.financial_metric('Strong Buy/Buy/Hold:', f"{analyst_data['strong_buy']}/{analyst_data['buy']}/{analyst_data['hold']}")
-    pdf.financial_metric('Sell/Strong Sell:', f"{analyst_data['sell']}/{analyst_data['strong_sell']}")
+    pdf.financial_metrics_table([
+        ('Target Price Range:', f"{currency['target_low_price']} - {currency['target_high_price']}"),
+        ('Strong Buy/Buy/Hold:', f"{analyst_data['strong_buy']}/{analyst_data['buy']}/{analyst_data['hold']}"),
+        ('Sell/Strong Sell:', f"{analyst_data['sell']}/{analyst_data['strong_sell']}"),
+    ])
     pdf.ln(5)
     pdf.chapter_body(analyst_section['insight'])
     pdf.ai_signal(analyst_section['signal'])
 
     # Recent News
-    news_section = next(s for s in data['sections'] if s['name'] == 'Recent News')
+    news_section = sections_by_name['Recent News']
     pdf.chapter_title('Recent News Highlights')
     for news in news_section['data'][:3]:
-        pdf.set_font('Arial', 'B', 10)
+        pdf.set_font('Helvetica', 'B', 10)
         
-        sanitized_title = re.sub(r'[^a-zA-Z0-9 ]', '', news['title'])  
+        sanitized_title = _SANITIZE.sub('', news['title'])  
         pdf.multi_cell(0, 5, sanitized_title)
 
-        pdf.set_font('Arial', 'I', 8)
-        pdf.cell(0, 5, f"Source: {news['publisher']}", 0, 1)
+        pdf.set_font('Helvetica', 'I', 8)
+        pdf.cell(0, 5, f"Source: {news['publisher']}", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         pdf.ln(2)
     
-    sanitized_insight = re.sub(r'[^a-zA-Z0-9 ]', '', news_section['insight'])
+    sanitized_insight = _SANITIZE.sub('', news_section['insight'])
     pdf.chapter_body(sanitized_insight)
     pdf.ai_signal(news_section['signal'])
 
     pdf.add_page()
     pdf.chapter_title('Important Disclaimers')
-    pdf.set_font('Arial', '', 9)
+    pdf.set_font('Helvetica', '', 9)
     pdf.multi_cell(0, 5, """This report contains AI-generated insights and signals that are based on historical data and current market information. Each section contains insights prefixed with "AI Insights:" which are generated through artificial intelligence analysis of various data points. These insights should not be considered as financial advice or recommendations to buy, sell, or hold any securities. The AI signals (Positive, Neutral, Negative) are algorithmic interpretations of data patterns and should be used as one of many tools in your investment research process.
 
 Always conduct your own due diligence and consult with a qualified financial advisor before making any investment decisions. Past performance is not indicative of future results. Market conditions can change rapidly, and the information contained in this report may quickly become outdated.
@@ -1,45 +1,98 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import instructor
 from openai import OpenAI
 from pydantic import BaseModel
 
-def generate_insights_for_sections(report: Dict, model: str):
-    """Generate LLM insights for each section of the report."""
-    class Insight(BaseModel):
-        insight: str
-        signal: int
-    client = instructor.from_openai(
+class Insight(BaseModel):
+    insight: str
+    signal: int
+
+_PROMPT_TMPL = """
+        Analyze the provided {section_name} data in the context of a comprehensive Equity Research report.
+        Deliver clear and concise insights, including actionable recommendations, while highlighting key risks and opportunities.
+        Based on your analysis, assign a signal: Buy 1, Sell -1, or Hold 0
+        {content}
+        """
+
+# Fields sent to the LLM per section; sections not listed are sent in full.
+# "error" is kept so the model still sees why a section has no data.
+_LLM_FIELDS = {
+    "Financial Performance": {
+        "revenue", "net_income", "operating_cash_flow", "free_cash_flow",
+        "profit_margins", "gross_margins", "revenue_growth", "earnings_growth",
+        "return_on_equity", "trailing_pe_ratio", "forward_pe_ratio",
+        "debt_to_equity", "current_ratio", "error",
+    },
+    "Market Performance": {
+        "current_price", "average_price", "price_change", "high_low_spread",
+        "volatility", "52_week_high", "52_week_low", "beta", "error",
+    },
+    "Recent News": {"title", "publisher", "providerPublishTime", "error"},
+}
+
+def _trim_section_data(section_name: str, data: Any) -> Any:
+    """Project section data (a dict, or a list of dicts) onto the section's LLM fields."""
+    fields = _LLM_FIELDS.get(section_name)
+    if fields is None:
+        return data
+    if isinstance(data, dict):
+        return {k: v for k, v in data.items() if k in fields}
+    if isinstance(data, list):
+        return [_trim_section_data(section_name, item) for item in data]
+    return data
+
+@lru_cache(maxsize=None)
+def _get_client():
+    """Build the instructor client for the local Ollama endpoint once and reuse it."""
+    return instructor.from_openai(
         OpenAI(
             base_url="http://localhost:11434/v1",
             api_key="ollama",
         ),
         mode=instructor.Mode.JSON,
     )
-    
+
+def _insight_for_section(section: Dict, client, model: str) -> Tuple[Dict, str, int]:
+    """Generate the insight and signal for a single report section."""
+    section_name = section.get("name", "Unknown Section")
+    content = json.dumps(
+        _trim_section_data(section_name, section.get("data", "")),
+        separators=(",", ":"),
+        default=str,
+    )
+
+    prompt = _PROMPT_TMPL.format(section_name=section_name, content=content)
+
+    try:
+        resp = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            response_model=Insight,
+        )
+        return section, resp.insight, resp.signal
+    except Exception as e:
+        return section, f"Error generating insight: {e}", 0
+
+def generate_insights_for_sections(report: Dict, model: str):
+    """Generate LLM insights for each section of the report."""
     if "sections" not in report:
         raise ValueError("Report must contain a 'sections' key")
-    
-    for section in report["sections"]:
-        content = section.get("data", "")
-        section_name = section.get("name", "Unknown Section")
-        
-        prompt = f"""
-        Analyze the provided {section_name} data in the context of a comprehensive Equity Research report. 
-        Deliver clear and concise insights, including actionable recommendations, while highlighting key risks and opportunities. 
-        Based on your analysis, assign a signal: Buy 1, Sell -1, or Hold 0
-        {content}
-        """
-        
-        try:
-            resp = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                response_model=Insight,
-            )
-            section["insight"] = resp.insight
-            section["signal"] = resp.signal
-        except Exception as e:
-            section["insight"] = f"Error generating insight: {e}"
-            section["signal"] = 0
-    
+
+    client = _get_client()
+
+    sections = report["sections"]
+    if not sections:
+        return report
+
+    # Requests are I/O-bound on the Ollama endpoint, so threads are sufficient
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        futures = [executor.submit(_insight_for_section, section, client, model) for section in sections]
+        for future in futures:
+            section, insight, signal = future.result()
+            section["insight"] = insight
+            section["signal"] = signal
+
     return report
@@ -1,45 +1,62 @@
 import pandas as pd
 import datetime
-from ai_equity_researcher.analyzer import StockAnalyzer
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ai_equity_researcher.analyzer import StockAnalyzer, compute_market_histories_batch, download_histories, get_quarter_date_range
 from ai_equity_researcher.llm import generate_insights_for_sections
 from ai_equity_researcher.generate_report import save_report_to_pdf
+
+YEAR = 2024
+QUARTER = "Q4"
+
+def process_ticker(ticker_symbol, history=None):
+    analyzer = StockAnalyzer(ticker_symbol)
+    report = analyzer.generate_report(year=YEAR, quarter=QUARTER, history=history)
+    report = generate_insights_for_sections(report,model='phi4')
+
+    save_report_to_pdf(report,ticker_symbol)
+    data = report.copy()
+    parsed_data = {'ticker': data['ticker'], 'report_date': data['report_date']}
+
+    # Flatten each section's data, followed by its insight and signal, into "<section>_<key>" columns
+    parsed_data.update(
+        (f"{section['name']}_{key}", value)
+        for section in data['sections']
+        for key, value in chain(
+            section['data'].items() if isinstance(section['data'], dict) else (),
+            (('insight', section['insight']), ('signal', section['signal'])),
+        )
+    )
+
+    return data, parsed_data
+
 def main():
     tickers = ["AAPL", "MSFT"]
     reports = []
 
-    for ticker_symbol in tickers:
-        analyzer = StockAnalyzer(ticker_symbol)
-        report = analyzer.generate_report(year=2024, quarter="Q4")
-        report = generate_insights_for_sections(report,model='phi4')
-
-        save_report_to_pdf(report,ticker_symbol)
-        data = report.copy()
-        parsed_data = {}
-        parsed_data['ticker'] = data['ticker']
-        parsed_data['report_date'] = data['report_date']
-
-        for section in data['sections']:
-            section_name = section['name']
-            for key, value in section['data'].items() if isinstance(section['data'], dict) else []:
-                parsed_data[f"{section_name}_{key}"] = value
+    # Load every ticker's price history for the quarter, batching any cache misses into one download
+    start_date, end_date = get_quarter_date_range(YEAR, QUARTER)
+    prices = download_histories(tickers, start_date, end_date)
 
-            # Add insights and signal separately
-            parsed_data[f"{section_name}_insight"] = section['insight']
-            parsed_data[f"{section_name}_signal"] = section['signal']
+    # Screen every ticker's market statistics in a single parallel JIT call
+    histories = compute_market_histories_batch(prices)
 
-        # Convert the parsed data into a DataFrame
-        parsed_df = pd.DataFrame([parsed_data])
+    # Each ticker is independent and I/O-bound (yfinance + LLM), so run them concurrently
+    rows = {}
+    with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+        futures = {executor.submit(process_ticker, ticker_symbol, histories[ticker_symbol]): ticker_symbol for ticker_symbol in tickers}
+        for future in as_completed(futures):
+            data, parsed_data = future.result()
+            reports.append(data)
+            rows[futures[future]] = parsed_data
 
-        data_dir = "data/"
-        filename = f"{data_dir}EquityResearch_{ticker_symbol}.csv"
-        
-        # Save the parsed DataFrame to a new CSV
-        parsed_df.to_csv(filename, index=False)
-        reports.append(data)
-        print("CSV file parsed and saved as 'parsed_output.csv'")
+    # Write every ticker's row to a single CSV, in the order the tickers were requested
+    filename = "data/EquityResearch_all.csv"
+    pd.DataFrame([rows[ticker_symbol] for ticker_symbol in tickers]).to_csv(filename, index=False)
+    print(f"CSV file parsed and saved as '{filename}'")
 
 
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()